@@ -7,7 +7,7 @@ from __future__ import annotations as _annotations
 
 import sys
 import warnings
-from collections.abc import Hashable, Mapping
+from collections.abc import Hashable, Mapping, Sequence
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from re import Pattern
@@ -2609,7 +2609,7 @@ class UnionSchema(TypedDict, total=False):
 
 
 def union_schema(
-    choices: list[CoreSchema | tuple[CoreSchema, str]],
+    choices: Sequence[CoreSchema | tuple[CoreSchema, str]],
     *,
     auto_collapse: bool | None = None,
     custom_error_type: str | None = None,
@@ -2633,7 +2633,7 @@ def union_schema(
     ```
 
     Args:
-        choices: The schemas to match. If a tuple, the second item is used as the label for the case.
+        choices: The schemas to match, stored as a list. If a tuple, the second item is used as the label for the case.
         auto_collapse: whether to automatically collapse unions with one element to the inner validator, default true
         custom_error_type: The custom error type to use if the validation fails
         custom_error_message: The custom error message to use if the validation fails
@@ -2647,7 +2647,7 @@ def union_schema(
     """
     return _dict_not_none(
         type='union',
-        choices=choices,
+        choices=choices if isinstance(choices, list) else list(choices),
         auto_collapse=auto_collapse,
         custom_error_type=custom_error_type,
         custom_error_message=custom_error_message,
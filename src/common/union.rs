@@ -1,8 +1,20 @@
 use pyo3::prelude::*;
-use pyo3::{PyTraverseError, PyVisit};
+use pyo3::types::{PyDict, PySequence, PyString};
+use pyo3::{intern, PyTraverseError, PyVisit};
 
+use crate::build_tools::py_schema_err;
 use crate::lookup_key::LookupKey;
 use crate::py_gc::PyGcTraverse;
+use crate::tools::SchemaDict;
+
+/// The `choices` of a union schema, which can be any sequence of schemas except a string
+pub fn union_choices<'py>(schema: &Bound<'py, PyDict>) -> PyResult<Bound<'py, PySequence>> {
+    let choices: Bound<'py, PyAny> = schema.get_as_req(intern!(schema.py(), "choices"))?;
+    if choices.is_instance_of::<PyString>() {
+        return py_schema_err!("Union choices must be a sequence of schemas, not a string");
+    }
+    Ok(choices.downcast_into::<PySequence>()?)
+}
 
 #[derive(Debug)]
 pub enum Discriminator {
@@ -21,6 +21,24 @@ pub enum InputType {
     String,
 }
 
+/// Scalar types which an input can be an exact match for, used by smart unions to find the choices
+/// worth trying first, e.g. an exact `int` is never an exact match for a `float`, `bool` or `str` validator
+#[derive(Debug, Clone, Copy)]
+pub enum ExactScalar {
+    Int,
+    Float,
+    Bool,
+    Str,
+    Bytes,
+    // must stay the last variant, see `COUNT`
+    None,
+}
+
+impl ExactScalar {
+    /// number of variants, used to size lookups indexed by `ExactScalar as usize`
+    pub const COUNT: usize = Self::None as usize + 1;
+}
+
 impl<'py> IntoPyObject<'py> for InputType {
     type Target = PyString;
     type Output = Borrowed<'py, 'py, PyString>;
@@ -73,6 +91,11 @@ pub trait Input<'py>: fmt::Debug {
         None
     }
 
+    /// The scalar type for which this input would be an exact match, if any
+    fn exact_scalar(&self) -> Option<ExactScalar> {
+        None
+    }
+
     fn as_kwargs(&self, py: Python<'py>) -> Option<Bound<'py, PyDict>>;
 
     type Arguments<'a>: Arguments<'py>
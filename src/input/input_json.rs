@@ -23,8 +23,8 @@ use super::input_abstract::{ConsumeIterator, Never, ValMatch};
 use super::return_enums::ValidationMatch;
 use super::shared::{float_as_int, int_as_bool, str_as_bool, str_as_float, str_as_int};
 use super::{
-    Arguments, BorrowInput, EitherBytes, EitherFloat, EitherInt, EitherString, EitherTimedelta, GenericIterator, Input,
-    KeywordArgs, PositionalArgs, ValidatedDict, ValidatedList, ValidatedSet, ValidatedTuple,
+    Arguments, BorrowInput, EitherBytes, EitherFloat, EitherInt, EitherString, EitherTimedelta, ExactScalar,
+    GenericIterator, Input, KeywordArgs, PositionalArgs, ValidatedDict, ValidatedList, ValidatedSet, ValidatedTuple,
 };
 
 /// This is required but since JSON object keys are always strings, I don't think it can be called
@@ -59,6 +59,17 @@ impl<'py, 'data> Input<'py> for JsonValue<'data> {
         matches!(self, JsonValue::Null)
     }
 
+    fn exact_scalar(&self) -> Option<ExactScalar> {
+        match self {
+            JsonValue::Null => Some(ExactScalar::None),
+            JsonValue::Bool(_) => Some(ExactScalar::Bool),
+            JsonValue::Int(_) | JsonValue::BigInt(_) => Some(ExactScalar::Int),
+            JsonValue::Float(_) => Some(ExactScalar::Float),
+            // JSON strings are only ever a strict match, see `validate_str`
+            _ => None,
+        }
+    }
+
     fn as_kwargs(&self, py: Python<'py>) -> Option<Bound<'py, PyDict>> {
         let JsonValue::Object(object) = self else {
             return None;
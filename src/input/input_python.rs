@@ -44,8 +44,8 @@ use super::ValidatedList;
 use super::ValidatedSet;
 use super::ValidatedTuple;
 use super::{
-    py_string_str, BorrowInput, EitherBytes, EitherFloat, EitherInt, EitherString, EitherTimedelta, GenericIterator,
-    Input,
+    py_string_str, BorrowInput, EitherBytes, EitherFloat, EitherInt, EitherString, EitherTimedelta, ExactScalar,
+    GenericIterator, Input,
 };
 
 static FRACTION_TYPE: PyOnceLock<Py<PyType>> = PyOnceLock::new();
@@ -109,6 +109,24 @@ impl<'py> Input<'py> for Bound<'py, PyAny> {
         Some(self)
     }
 
+    fn exact_scalar(&self) -> Option<ExactScalar> {
+        if PyAnyMethods::is_none(self) {
+            Some(ExactScalar::None)
+        } else if self.is_exact_instance_of::<PyInt>() {
+            Some(ExactScalar::Int)
+        } else if self.is_exact_instance_of::<PyFloat>() {
+            Some(ExactScalar::Float)
+        } else if self.is_exact_instance_of::<PyBool>() {
+            Some(ExactScalar::Bool)
+        } else if self.is_exact_instance_of::<PyString>() {
+            Some(ExactScalar::Str)
+        } else if self.is_exact_instance_of::<PyBytes>() {
+            Some(ExactScalar::Bytes)
+        } else {
+            None
+        }
+    }
+
     fn as_kwargs(&self, _py: Python<'py>) -> Option<Bound<'py, PyDict>> {
         self.downcast::<PyDict>().ok().map(Bound::to_owned)
     }
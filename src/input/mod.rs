@@ -16,7 +16,7 @@ pub(crate) use datetime::{
     EitherTimedelta,
 };
 pub(crate) use input_abstract::{
-    Arguments, BorrowInput, ConsumeIterator, Input, InputType, KeywordArgs, PositionalArgs, ValidatedDict,
+    Arguments, BorrowInput, ConsumeIterator, ExactScalar, Input, InputType, KeywordArgs, PositionalArgs, ValidatedDict,
     ValidatedList, ValidatedSet, ValidatedTuple,
 };
 pub(crate) use input_python::{downcast_python_input, input_as_python_instance};
@@ -1,13 +1,13 @@
 use ahash::AHashMap as HashMap;
 use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList, PyTuple};
+use pyo3::types::{PyDict, PyTuple};
 use smallvec::SmallVec;
 use std::borrow::Cow;
 use std::sync::Arc;
 
 use crate::build_tools::py_schema_err;
-use crate::common::union::{Discriminator, SMALL_UNION_THRESHOLD};
+use crate::common::union::{union_choices, Discriminator, SMALL_UNION_THRESHOLD};
 use crate::definitions::DefinitionsBuilder;
 use crate::serializers::PydanticSerializationUnexpectedValue;
 use crate::serializers::SerializationState;
@@ -31,11 +31,10 @@ impl BuildSerializer for UnionSerializer {
         config: Option<&Bound<'_, PyDict>>,
         definitions: &mut DefinitionsBuilder<Arc<CombinedSerializer>>,
     ) -> PyResult<Arc<CombinedSerializer>> {
-        let py = schema.py();
-        let choices = schema
-            .get_as_req::<Bound<'_, PyList>>(intern!(py, "choices"))?
-            .iter()
+        let choices = union_choices(schema)?
+            .try_iter()?
             .map(|choice| {
+                let choice = choice?;
                 let choice = match choice.downcast::<PyTuple>() {
                     Ok(py_tuple) => py_tuple.get_item(0)?,
                     Err(_) => choice,
@@ -118,6 +118,12 @@ impl BuildValidator for ListValidator {
 
 impl_py_gc_traverse!(ListValidator { item_validator });
 
+impl ListValidator {
+    pub(super) fn item_validator(&self) -> Option<&CombinedValidator> {
+        self.item_validator.as_deref()
+    }
+}
+
 impl Validator for ListValidator {
     fn validate<'py>(
         &self,
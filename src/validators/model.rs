@@ -245,6 +245,11 @@ impl Validator for ModelValidator {
 }
 
 impl ModelValidator {
+    /// The model class, if exact instances of it are always returned unchanged by `validate`
+    pub(super) fn passthrough_class(&self) -> Option<&Py<PyType>> {
+        matches!(self.revalidate, Revalidate::Never).then_some(&self.class)
+    }
+
     /// here we just call the inner validator, then set attributes on `self_instance`
     fn validate_init<'py>(
         &self,
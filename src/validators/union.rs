@@ -3,6 +3,7 @@ use std::str::FromStr;
 use std::sync::Arc;
 
 use crate::py_gc::PyGcTraverse;
+use ahash::AHashMap;
 use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyList, PyString, PyTuple};
 use pyo3::{intern, PyTraverseError, PyVisit};
@@ -10,9 +11,9 @@ use smallvec::SmallVec;
 
 use crate::build_tools::py_schema_err;
 use crate::build_tools::schema_or_config;
-use crate::common::union::{Discriminator, SMALL_UNION_THRESHOLD};
+use crate::common::union::{union_choices, Discriminator, SMALL_UNION_THRESHOLD};
 use crate::errors::{ErrorType, ToErrorValue, ValError, ValLineError, ValResult};
-use crate::input::{BorrowInput, Input, ValidatedDict};
+use crate::input::{BorrowInput, ExactScalar, Input, ValidatedDict};
 use crate::tools::SchemaDict;
 
 use super::custom_error::CustomError;
@@ -39,12 +40,109 @@ impl FromStr for UnionMode {
     }
 }
 
+/// The kind of input each scalar validator can report an exact match for; each kind of input is only
+/// ever an exact match for one kind of scalar validator, e.g. an exact `int` is never an exact match for
+/// a `float`, `bool` or `str` validator, and `None` is only ever valid for a `none` validator.
+fn validator_exact_scalar(validator: &CombinedValidator) -> Option<ExactScalar> {
+    match validator {
+        CombinedValidator::Int(_) | CombinedValidator::ConstrainedInt(_) => Some(ExactScalar::Int),
+        CombinedValidator::Float(_) | CombinedValidator::ConstrainedFloat(_) => Some(ExactScalar::Float),
+        CombinedValidator::Bool(_) => Some(ExactScalar::Bool),
+        CombinedValidator::Str(_) | CombinedValidator::StrConstrained(_) => Some(ExactScalar::Str),
+        CombinedValidator::Bytes(_) | CombinedValidator::ConstrainedBytes(_) => Some(ExactScalar::Bytes),
+        CombinedValidator::None(_) => Some(ExactScalar::None),
+        _ => None,
+    }
+}
+
+/// Maps each `ExactScalar` to a bitmask of the choices which could report an exact match for it.
+type ExactScalarLookup = [u64; ExactScalar::COUNT];
+
+fn build_exact_scalar_lookup(
+    choices: &[(Arc<CombinedValidator>, Option<String>)],
+    scalar_of: impl Fn(&CombinedValidator) -> Option<ExactScalar>,
+) -> Option<ExactScalarLookup> {
+    let mut lookup: ExactScalarLookup = [0; ExactScalar::COUNT];
+    for (index, (choice, _)) in choices.iter().enumerate() {
+        lookup[scalar_of(choice.as_ref())? as usize] |= 1 << index;
+    }
+    Some(lookup)
+}
+
+fn list_item_scalar(validator: &CombinedValidator) -> Option<ExactScalar> {
+    match validator {
+        CombinedValidator::List(list) => validator_exact_scalar(list.item_validator()?),
+        _ => None,
+    }
+}
+
+/// For smart unions where every choice is a model or dataclass which returns exact instances of its class
+/// unchanged, maps each class (by type pointer) to its choice.
+type ExactInstanceLookup = AHashMap<usize, usize>;
+
+fn build_exact_instance_lookup(choices: &[(Arc<CombinedValidator>, Option<String>)]) -> Option<ExactInstanceLookup> {
+    let mut lookup = AHashMap::with_capacity(choices.len());
+    for (index, (choice, _)) in choices.iter().enumerate() {
+        let class = match choice.as_ref() {
+            CombinedValidator::Model(model) => model.passthrough_class()?,
+            CombinedValidator::Dataclass(dataclass) => dataclass.passthrough_class()?,
+            _ => return None,
+        };
+        lookup.entry(class.as_ptr() as usize).or_insert(index);
+    }
+    Some(lookup)
+}
+
+/// Finds the few choices of a smart union which could be an exact match for an input, so they can be
+/// tried before all others - no other choice can beat an exact match from one of them.
+#[derive(Debug)]
+enum ExactChoiceLookup {
+    /// every choice is a scalar validator
+    Scalar(ExactScalarLookup),
+    /// every choice is a list of a scalar, a list can only be an exact match if its first item is
+    ListItems(ExactScalarLookup),
+    /// every choice is a model or dataclass which returns exact instances of its class unchanged
+    Instance(ExactInstanceLookup),
+}
+
+impl ExactChoiceLookup {
+    fn build(choices: &[(Arc<CombinedValidator>, Option<String>)]) -> Option<Self> {
+        // candidates are stored as a bitmask of choice indices
+        if choices.len() > u64::BITS as usize {
+            return None;
+        }
+        build_exact_scalar_lookup(choices, validator_exact_scalar)
+            .map(Self::Scalar)
+            .or_else(|| build_exact_scalar_lookup(choices, list_item_scalar).map(Self::ListItems))
+            .or_else(|| build_exact_instance_lookup(choices).map(Self::Instance))
+    }
+
+    /// Bitmask of the choices which could be an exact match for this input
+    fn candidates<'py>(&self, input: &(impl Input<'py> + ?Sized), state: &ValidationState<'_, 'py>) -> u64 {
+        match self {
+            Self::Scalar(lookup) => input.exact_scalar().map_or(0, |scalar| lookup[scalar as usize]),
+            Self::ListItems(lookup) => input
+                .as_python()
+                .and_then(|py_input| py_input.downcast::<PyList>().ok()?.get_item(0).ok())
+                .and_then(|first_item| first_item.exact_scalar())
+                .map_or(0, |scalar| lookup[scalar as usize]),
+            // within `__init__`, models and dataclasses validate into `self_instance` rather than returning the input
+            Self::Instance(_) if state.extra().self_instance.is_some() => 0,
+            Self::Instance(lookup) => input
+                .as_python()
+                .and_then(|py_input| lookup.get(&(py_input.get_type_ptr() as usize)))
+                .map_or(0, |index| 1 << index),
+        }
+    }
+}
+
 #[derive(Debug)]
 pub struct UnionValidator {
     mode: UnionMode,
     choices: Vec<(Arc<CombinedValidator>, Option<String>)>,
     custom_error: Option<CustomError>,
     name: String,
+    exact_choice_lookup: Option<ExactChoiceLookup>,
 }
 
 impl BuildValidator for UnionValidator {
@@ -56,10 +154,10 @@ impl BuildValidator for UnionValidator {
         definitions: &mut DefinitionsBuilder<Arc<CombinedValidator>>,
     ) -> PyResult<Arc<CombinedValidator>> {
         let py = schema.py();
-        let choices: Vec<(Arc<CombinedValidator>, Option<String>)> = schema
-            .get_as_req::<Bound<'_, PyList>>(intern!(py, "choices"))?
-            .iter()
+        let choices: Vec<(Arc<CombinedValidator>, Option<String>)> = union_choices(schema)?
+            .try_iter()?
             .map(|choice| {
+                let choice = choice?;
                 let mut label: Option<String> = None;
                 let choice = match choice.downcast::<PyTuple>() {
                     Ok(py_tuple) => {
@@ -87,11 +185,17 @@ impl BuildValidator for UnionValidator {
                     .collect::<Vec<_>>()
                     .join(",");
 
+                let exact_choice_lookup = match mode {
+                    UnionMode::Smart => ExactChoiceLookup::build(&choices),
+                    UnionMode::LeftToRight => None,
+                };
+
                 Ok(CombinedValidator::Union(Self {
                     mode,
                     choices,
                     custom_error: CustomError::build(schema, config, definitions)?,
                     name: format!("{}[{descr}]", Self::EXPECTED_TYPE),
+                    exact_choice_lookup,
                 })
                 .into())
             }
@@ -109,14 +213,53 @@ impl UnionValidator {
         let old_exactness = state.exactness;
         let old_fields_set_count = state.fields_set_count;
 
+        // if only a few choices can be an exact match for this input, try them first, in order, the first exact
+        // match among them is what the loop below would return; other outcomes are kept for the loop to reuse
+        let mut tried: SmallVec<[TriedChoice; SMALL_UNION_THRESHOLD]> = SmallVec::new();
+        let mut candidates = match &self.exact_choice_lookup {
+            Some(lookup) => lookup.candidates(input, state),
+            None => 0,
+        };
+        while candidates != 0 {
+            let index = candidates.trailing_zeros() as usize;
+            candidates &= candidates - 1;
+
+            state.exactness = Some(Exactness::Exact);
+            state.fields_set_count = None;
+            match self.choices[index].0.validate(py, input, state) {
+                Ok(success) if state.exactness == Some(Exactness::Exact) && state.fields_set_count.is_none() => {
+                    state.exactness = old_exactness;
+                    state.fields_set_count = old_fields_set_count;
+                    return Ok(success);
+                }
+                result @ (Ok(_) | Err(ValError::LineErrors(_))) => tried.push(TriedChoice {
+                    index,
+                    result,
+                    exactness: state.exactness,
+                    fields_set_count: state.fields_set_count,
+                }),
+                otherwise => return otherwise,
+            }
+        }
+
         let mut errors = MaybeErrors::new(self.custom_error.as_ref());
 
         let mut best_match: Option<(Py<PyAny>, Exactness, Option<usize>)> = None;
 
-        for (choice, label) in &self.choices {
-            state.exactness = Some(Exactness::Exact);
-            state.fields_set_count = None;
-            let result = choice.validate(py, input, state);
+        for (index, (choice, label)) in self.choices.iter().enumerate() {
+            let result = match tried.iter().position(|tried_choice| tried_choice.index == index) {
+                Some(position) => {
+                    let tried_choice = tried.swap_remove(position);
+                    state.exactness = tried_choice.exactness;
+                    state.fields_set_count = tried_choice.fields_set_count;
+                    tried_choice.result
+                }
+                None => {
+                    state.exactness = Some(Exactness::Exact);
+                    state.fields_set_count = None;
+                    choice.validate(py, input, state)
+                }
+            };
             match result {
                 Ok(new_success) => match (state.exactness, state.fields_set_count) {
                     (Some(Exactness::Exact), None) => {
@@ -226,6 +369,14 @@ impl Validator for UnionValidator {
     }
 }
 
+/// The outcome of a choice tried ahead of the main smart union loop
+struct TriedChoice {
+    index: usize,
+    result: ValResult<Py<PyAny>>,
+    exactness: Option<Exactness>,
+    fields_set_count: Option<usize>,
+}
+
 struct ChoiceLineErrors<'a> {
     choice: &'a CombinedValidator,
     label: Option<&'a str>,
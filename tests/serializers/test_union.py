@@ -31,6 +31,17 @@ def test_union_bool_int(input_value, expected_value, bool_case_label, int_case_l
     assert s.to_json(input_value) == json.dumps(expected_value).encode()
 
 
+def test_union_tuple_choices():
+    s = SchemaSerializer(
+        core_schema.union_schema((core_schema.bool_schema(), (core_schema.int_schema(), 'my_int_label')))
+    )
+
+    assert s.to_python(True) is True
+    assert s.to_python(123) == 123
+    assert s.to_python(123, mode='json') == 123
+    assert s.to_json(123) == b'123'
+
+
 def test_union_error():
     s = SchemaSerializer(core_schema.union_schema([core_schema.bool_schema(), core_schema.int_schema()]))
 
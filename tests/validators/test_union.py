@@ -15,6 +15,16 @@ from pydantic_core import CoreConfig, SchemaError, SchemaValidator, ValidationEr
 from ..conftest import plain_repr
 
 
+@pytest.fixture(scope='module', name='bool_int_validator')
+def bool_int_validator_fixture() -> SchemaValidator:
+    return SchemaValidator(core_schema.union_schema(choices=[core_schema.bool_schema(), core_schema.int_schema()]))
+
+
+@pytest.fixture(scope='module', name='int_bool_validator')
+def int_bool_validator_fixture() -> SchemaValidator:
+    return SchemaValidator(core_schema.union_schema(choices=[core_schema.int_schema(), core_schema.bool_schema()]))
+
+
 @pytest.mark.parametrize(
     'input_value,expected_value',
     [
@@ -30,9 +40,8 @@ from ..conftest import plain_repr
         ('1', True),  # this case is different depending on the order of the choices
     ],
 )
-def test_union_bool_int(input_value, expected_value):
-    v = SchemaValidator(core_schema.union_schema(choices=[core_schema.bool_schema(), core_schema.int_schema()]))
-    assert v.validate_python(input_value) == expected_value
+def test_union_bool_int(bool_int_validator: SchemaValidator, input_value, expected_value):
+    assert bool_int_validator.validate_python(input_value) == expected_value
 
 
 @pytest.mark.parametrize(
@@ -50,9 +59,8 @@ def test_union_bool_int(input_value, expected_value):
         ('1', 1),  # this case is different depending on the order of the choices
     ],
 )
-def test_union_int_bool(input_value, expected_value):
-    v = SchemaValidator(core_schema.union_schema(choices=[core_schema.int_schema(), core_schema.bool_schema()]))
-    assert v.validate_python(input_value) == expected_value
+def test_union_int_bool(int_bool_validator: SchemaValidator, input_value, expected_value):
+    assert int_bool_validator.validate_python(input_value) == expected_value
 
 
 class TestModelClass:
@@ -186,10 +194,146 @@ class TestModelClassSimilar:
         assert m2.c == 2.0
 
 
+@pytest.mark.parametrize('revalidate_instances', ['never', 'always'])
+def test_model_instances_subclass(revalidate_instances):
+    class ModelA:
+        a: int
+
+    class ModelB(ModelA):
+        b: int
+
+    v = SchemaValidator(
+        core_schema.union_schema(
+            [
+                core_schema.model_schema(
+                    ModelA,
+                    core_schema.model_fields_schema(fields={'a': core_schema.model_field(core_schema.int_schema())}),
+                    revalidate_instances=revalidate_instances,
+                ),
+                core_schema.model_schema(
+                    ModelB,
+                    core_schema.model_fields_schema(
+                        fields={
+                            'a': core_schema.model_field(core_schema.int_schema()),
+                            'b': core_schema.model_field(core_schema.int_schema()),
+                        }
+                    ),
+                ),
+            ]
+        )
+    )
+
+    m_a = v.validate_python({'a': 1})
+    assert isinstance(m_a, ModelA)
+    m_b = v.validate_python({'a': 1, 'b': 2})
+    assert isinstance(m_b, ModelB)
+
+    assert v.validate_python(m_b) is m_b
+    if revalidate_instances == 'never':
+        assert v.validate_python(m_a) is m_a
+    else:
+        m_a2 = v.validate_python(m_a)
+        assert m_a2 is not m_a
+        assert isinstance(m_a2, ModelA)
+        assert m_a2.a == 1
+
+    @dataclass
+    class DataclassA:
+        a: int
+
+    @dataclass
+    class DataclassB(DataclassA):
+        b: int
+
+    v = SchemaValidator(
+        core_schema.union_schema(
+            [
+                core_schema.dataclass_schema(
+                    DataclassA,
+                    core_schema.dataclass_args_schema(
+                        'DataclassA', [core_schema.dataclass_field('a', core_schema.int_schema())]
+                    ),
+                    ['a'],
+                    revalidate_instances=revalidate_instances,
+                ),
+                core_schema.dataclass_schema(
+                    DataclassB,
+                    core_schema.dataclass_args_schema(
+                        'DataclassB',
+                        [
+                            core_schema.dataclass_field('a', core_schema.int_schema()),
+                            core_schema.dataclass_field('b', core_schema.int_schema()),
+                        ],
+                    ),
+                    ['a', 'b'],
+                ),
+            ]
+        )
+    )
+
+    dc_a = v.validate_python({'a': 1})
+    assert type(dc_a) is DataclassA
+    dc_b = v.validate_python({'a': 1, 'b': 2})
+    assert type(dc_b) is DataclassB
+
+    assert v.validate_python(dc_b) is dc_b
+    if revalidate_instances == 'never':
+        assert v.validate_python(dc_a) is dc_a
+    else:
+        dc_a2 = v.validate_python(dc_a)
+        assert dc_a2 is not dc_a
+        assert dc_a2 == DataclassA(a=1)
+
+
+def test_model_instances_self_instance():
+    class ModelA:
+        a: int
+
+    class ModelB:
+        a: int
+        b: int
+
+    v = SchemaValidator(
+        core_schema.union_schema(
+            [
+                core_schema.model_schema(
+                    ModelA,
+                    core_schema.model_fields_schema(
+                        fields={'a': core_schema.model_field(core_schema.int_schema())}, from_attributes=True
+                    ),
+                ),
+                core_schema.model_schema(
+                    ModelB,
+                    core_schema.model_fields_schema(
+                        fields={
+                            'a': core_schema.model_field(core_schema.int_schema()),
+                            'b': core_schema.model_field(core_schema.int_schema()),
+                        },
+                        from_attributes=True,
+                    ),
+                ),
+            ]
+        )
+    )
+
+    m_b = ModelB()
+    m_b.a = 1
+    m_b.b = 2
+
+    # within `__init__` every choice validates into `self_instance` in order, even when the input
+    # is an exact instance of one of them, so the best match is the last to set its fields
+    self_instance = ModelB()
+    m = v.validate_python(m_b, self_instance=self_instance)
+    assert m is self_instance
+    assert m.__dict__ == {'a': 1, 'b': 2}
+    assert m.__pydantic_fields_set__ == {'a', 'b'}
+
+
 def test_nullable_via_union():
     v = SchemaValidator(core_schema.union_schema(choices=[core_schema.none_schema(), core_schema.int_schema()]))
     assert v.validate_python(None) is None
     assert v.validate_python(1) == 1
+    assert v.validate_python('1') == 1
     with pytest.raises(ValidationError) as exc_info:
         v.validate_python('hello')
     assert exc_info.value.errors(include_url=False) == [
@@ -203,6 +347,17 @@ def test_nullable_via_union():
     ]
 
 
+def test_nullable_via_union_none_last():
+    v = SchemaValidator(core_schema.union_schema(choices=[core_schema.int_schema(), core_schema.none_schema()]))
+    assert v.validate_python(None) is None
+    assert v.validate_python(1) == 1
+    assert v.validate_json('null') is None
+    assert v.validate_json('1') == 1
+    with pytest.raises(ValidationError) as exc_info:
+        v.validate_python('hello')
+    assert [e['type'] for e in exc_info.value.errors()] == ['int_parsing', 'none_required']
+
+
 def test_union_list_bool_int():
     v = SchemaValidator(
         core_schema.union_schema(
@@ -233,6 +388,23 @@ def test_union_list_bool_int():
     ]
 
 
+def test_union_list_int_float():
+    v = SchemaValidator(
+        core_schema.union_schema(
+            choices=[
+                core_schema.list_schema(items_schema=core_schema.int_schema()),
+                core_schema.list_schema(items_schema=core_schema.float_schema()),
+            ]
+        )
+    )
+    assert repr(v.validate_python([1, 2])) == '[1, 2]'
+    assert repr(v.validate_python([1.0, 2.0])) == '[1.0, 2.0]'
+    assert repr(v.validate_python([1.0, 2])) == '[1.0, 2.0]'
+    assert repr(v.validate_python([1, 2.0])) == '[1.0, 2.0]'
+    assert repr(v.validate_python(['1', '2'])) == '[1, 2]'
+    assert v.validate_python([]) == []
+
+
 @pytest.mark.xfail(
     platform.python_implementation() == 'PyPy' and sys.version_info[:2] == (3, 11), reason='pypy 3.11 type formatting'
 )
@@ -242,6 +414,19 @@ def test_empty_choices():
         SchemaValidator(core_schema.union_schema(choices=[]))
 
 
+def test_str_choices():
+    msg = r'Error building "union" validator:\s+SchemaError: Union choices must be a sequence of schemas, not a string'
+    with pytest.raises(SchemaError, match=msg):
+        SchemaValidator({'type': 'union', 'choices': 'ab'})  # type: ignore
+
+
+def test_tuple_choices_stored_as_list():
+    choices = (core_schema.int_schema(), core_schema.str_schema())
+    schema = core_schema.union_schema(choices)
+    assert schema['choices'] == list(choices)
+    assert isinstance(schema['choices'], list)
+
+
 def test_one_choice():
     v = SchemaValidator(core_schema.union_schema(choices=[core_schema.str_schema()]))
     assert (
@@ -373,6 +558,8 @@ def test_int_float():
     assert v.validate_json('1') == IsInt(approx=1, delta=0)
     assert v.validate_python(1.0) == IsFloat(approx=1, delta=0)
     assert v.validate_json('1.0') == IsFloat(approx=1, delta=0)
+    assert v.validate_json('12345678901234567890') == IsInt(approx=12345678901234567890, delta=0)
+    assert v.validate_json('true') == IsFloat(approx=1, delta=0)
 
 
 def test_str_float():
@@ -400,6 +587,19 @@ def test_str_float():
     assert v.validate_json('"1"') == '1'
 
 
+def test_constrained_scalar_falls_back():
+    v = SchemaValidator(core_schema.union_schema([core_schema.int_schema(gt=10), core_schema.float_schema()]))
+    assert v.validate_python(11) == IsInt(approx=11, delta=0)
+    assert v.validate_python(5) == IsFloat(approx=5, delta=0)
+
+    v = SchemaValidator(core_schema.union_schema([core_schema.int_schema(gt=10), core_schema.int_schema(lt=0)]))
+    assert v.validate_python(11) == 11
+    assert v.validate_python(-1) == -1
+    with pytest.raises(ValidationError) as exc_info:
+        v.validate_python(5)
+    assert [e['type'] for e in exc_info.value.errors()] == ['greater_than', 'less_than']
+
+
 def test_no_strict_check():
     v = SchemaValidator(core_schema.union_schema([core_schema.is_instance_schema(int), core_schema.json_schema()]))
     assert v.validate_python(123) == 123
@@ -454,12 +654,13 @@ def test_left_to_right_doesnt_care_about_strict_check():
     v = SchemaValidator(
         core_schema.union_schema([core_schema.int_schema(), core_schema.json_schema()], mode='left_to_right')
     )
-    assert 'strict_required' not in plain_repr(v)
-    assert 'ultra_strict_required' not in plain_repr(v)
+    v_repr = plain_repr(v)
+    assert 'strict_required' not in v_repr
+    assert 'ultra_strict_required' not in v_repr
 
 
 def test_left_to_right_union():
-    choices = [core_schema.int_schema(), core_schema.float_schema()]
+    choices = (core_schema.int_schema(), core_schema.float_schema())
 
     # smart union prefers float
     v = SchemaValidator(core_schema.union_schema(choices, mode='smart'))
@@ -478,7 +679,7 @@ def test_left_to_right_union():
     assert isinstance(out, int)
 
     # reversing them will select float
-    v = SchemaValidator(core_schema.union_schema(list(reversed(choices)), mode='left_to_right'))
+    v = SchemaValidator(core_schema.union_schema(choices[::-1], mode='left_to_right'))
     out = v.validate_python(1.0)
     assert out == 1.0
     assert isinstance(out, float)
@@ -489,7 +690,7 @@ def test_left_to_right_union():
 
 
 def test_left_to_right_union_strict():
-    choices = [core_schema.int_schema(strict=True), core_schema.float_schema(strict=True)]
+    choices = (core_schema.int_schema(strict=True), core_schema.float_schema(strict=True))
 
     # left_to_right union will select not cast if int first (strict int will not accept float)
     v = SchemaValidator(core_schema.union_schema(choices, mode='left_to_right'))
@@ -502,12 +703,7 @@ def test_left_to_right_union_strict():
     assert isinstance(out, float)
 
     # reversing union will select float always (as strict float will accept int)
-    v = SchemaValidator(
-        core_schema.union_schema(
-            list(reversed(choices)),
-            mode='left_to_right',
-        )
-    )
+    v = SchemaValidator(core_schema.union_schema(choices[::-1], mode='left_to_right'))
     out = v.validate_python(1.0)
     assert out == 1.0
     assert isinstance(out, float)
@@ -822,8 +1018,15 @@ def test_model_and_literal_union() -> None:
     assert validator.validate_python(True) is True
 
 
-def permute_choices(choices: list[core_schema.CoreSchema]) -> list[list[core_schema.CoreSchema]]:
-    return [list(p) for p in permutations(choices)]
+def permute_choices(choices: list[core_schema.CoreSchema]) -> tuple[tuple[core_schema.CoreSchema, ...], ...]:
+    if len(choices) == 2:
+        a, b = choices
+        return (a, b), (b, a)
+    return tuple(permutations(choices))
+
+
+def _first_choice_cls_name(choices: tuple[core_schema.CoreSchema, ...]) -> str:
+    return choices[0]['cls'].__name__
 
 
 class TestSmartUnionWithSubclass:
@@ -846,19 +1049,26 @@ class TestSmartUnionWithSubclass:
         ),
     )
 
-    @pytest.mark.parametrize('choices', permute_choices([model_a_schema, model_b_schema]))
+    @pytest.fixture(
+        scope='class',
+        params=permute_choices([model_a_schema, model_b_schema]),
+        ids=_first_choice_cls_name,
+    )
+    def choices(self, request) -> tuple[core_schema.CoreSchema, ...]:
+        return request.param
+
     def test_more_specific_data_matches_subclass(self, choices) -> None:
         validator = SchemaValidator(core_schema.union_schema(choices))
-        assert isinstance(validator.validate_python({'a': 1}), self.ModelA)
-        assert isinstance(validator.validate_python({'a': 1, 'b': 2}), self.ModelB)
-
-        assert isinstance(validator.validate_python({'a': 1, 'b': 2}), self.ModelB)
-
-        # confirm that a model that matches in lax mode with 2 fields
-        # is preferred over a model that matches in strict mode with 1 field
-        assert isinstance(validator.validate_python({'a': '1', 'b': '2'}), self.ModelB)
-        assert isinstance(validator.validate_python({'a': '1', 'b': 2}), self.ModelB)
-        assert isinstance(validator.validate_python({'a': 1, 'b': '2'}), self.ModelB)
+        cases = [
+            ({'a': 1}, self.ModelA),
+            ({'a': 1, 'b': 2}, self.ModelB),
+            # confirm that a model that matches in lax mode with 2 fields
+            # is preferred over a model that matches in strict mode with 1 field
+            ({'a': '1', 'b': '2'}, self.ModelB),
+            ({'a': '1', 'b': 2}, self.ModelB),
+            ({'a': 1, 'b': '2'}, self.ModelB),
+        ]
+        assert [type(validator.validate_python(data)) for data, _ in cases] == [cls for _, cls in cases]
 
 
 class TestSmartUnionWithDefaults:
@@ -881,7 +1091,14 @@ class TestSmartUnionWithDefaults:
         ),
     )
 
-    @pytest.mark.parametrize('choices', permute_choices([model_a_schema, model_b_schema]))
+    @pytest.fixture(
+        scope='class',
+        params=permute_choices([model_a_schema, model_b_schema]),
+        ids=_first_choice_cls_name,
+    )
+    def choices(self, request) -> tuple[core_schema.CoreSchema, ...]:
+        return request.param
+
     def test_fields_set_ensures_best_match(self, choices) -> None:
         validator = SchemaValidator(core_schema.union_schema(choices))
         assert isinstance(validator.validate_python({'a': 1}), self.ModelA)
@@ -890,7 +1107,6 @@ class TestSmartUnionWithDefaults:
         # defaults to leftmost choice if there's a tie
         assert isinstance(validator.validate_python({}), choices[0]['cls'])
 
-    @pytest.mark.parametrize('choices', permute_choices([model_a_schema, model_b_schema]))
     def test_optional_union_with_members_having_defaults(self, choices) -> None:
         class WrapModel:
             val: Optional[Union[self.ModelA, self.ModelB]] = None
@@ -916,7 +1132,7 @@ class TestSmartUnionWithDefaults:
         assert val.validate_python({}).val is None
 
 
-def test_dc_smart_union_by_fields_set() -> None:
+class TestDataclassSmartUnionByFieldsSet:
     @dataclass
     class ModelA:
         x: int
@@ -943,19 +1159,22 @@ def test_dc_smart_union_by_fields_set() -> None:
         ['x', 'y'],
     )
 
-    for choices in permute_choices([dc_a_schema, dc_b_schema]):
+    @pytest.mark.parametrize('choices', permute_choices([dc_a_schema, dc_b_schema]), ids=_first_choice_cls_name)
+    def test_dc_smart_union_by_fields_set(self, choices) -> None:
         validator = SchemaValidator(core_schema.union_schema(choices=choices))
 
-        assert isinstance(validator.validate_python({'x': 1}), ModelA)
-        assert isinstance(validator.validate_python({'x': '1'}), ModelA)
-
-        assert isinstance(validator.validate_python({'x': 1, 'y': 2}), ModelB)
-        assert isinstance(validator.validate_python({'x': 1, 'y': '2'}), ModelB)
-        assert isinstance(validator.validate_python({'x': '1', 'y': 2}), ModelB)
-        assert isinstance(validator.validate_python({'x': '1', 'y': '2'}), ModelB)
+        cases = [
+            ({'x': 1}, self.ModelA),
+            ({'x': '1'}, self.ModelA),
+            ({'x': 1, 'y': 2}, self.ModelB),
+            ({'x': 1, 'y': '2'}, self.ModelB),
+            ({'x': '1', 'y': 2}, self.ModelB),
+            ({'x': '1', 'y': '2'}, self.ModelB),
+        ]
+        assert [type(validator.validate_python(data)) for data, _ in cases] == [cls for _, cls in cases]
 
 
-def test_dc_smart_union_with_defaults() -> None:
+class TestDataclassSmartUnionWithDefaults:
     @dataclass
     class ModelA:
         a: int = 0
@@ -990,14 +1209,15 @@ def test_dc_smart_union_with_defaults() -> None:
         ['b'],
     )
 
-    for choices in permute_choices([dc_a_schema, dc_b_schema]):
+    @pytest.mark.parametrize('choices', permute_choices([dc_a_schema, dc_b_schema]), ids=_first_choice_cls_name)
+    def test_dc_smart_union_with_defaults(self, choices) -> None:
         validator = SchemaValidator(core_schema.union_schema(choices=choices))
 
-        assert isinstance(validator.validate_python({'a': 1}), ModelA)
-        assert isinstance(validator.validate_python({'b': 1}), ModelB)
+        assert isinstance(validator.validate_python({'a': 1}), self.ModelA)
+        assert isinstance(validator.validate_python({'b': 1}), self.ModelB)
 
 
-def test_td_smart_union_by_fields_set() -> None:
+class TestTypedDictSmartUnionByFieldsSet:
     td_a_schema = core_schema.typed_dict_schema(
         fields={'x': core_schema.typed_dict_field(core_schema.int_schema())},
     )
@@ -1009,19 +1229,22 @@ def test_td_smart_union_by_fields_set() -> None:
         },
     )
 
-    for choices in permute_choices([td_a_schema, td_b_schema]):
+    @pytest.mark.parametrize('choices', permute_choices([td_a_schema, td_b_schema]))
+    def test_td_smart_union_by_fields_set(self, choices) -> None:
         validator = SchemaValidator(core_schema.union_schema(choices=choices))
 
-        assert set(validator.validate_python({'x': 1}).keys()) == {'x'}
-        assert set(validator.validate_python({'x': '1'}).keys()) == {'x'}
-
-        assert set(validator.validate_python({'x': 1, 'y': 2}).keys()) == {'x', 'y'}
-        assert set(validator.validate_python({'x': 1, 'y': '2'}).keys()) == {'x', 'y'}
-        assert set(validator.validate_python({'x': '1', 'y': 2}).keys()) == {'x', 'y'}
-        assert set(validator.validate_python({'x': '1', 'y': '2'}).keys()) == {'x', 'y'}
+        cases = [
+            ({'x': 1}, {'x'}),
+            ({'x': '1'}, {'x'}),
+            ({'x': 1, 'y': 2}, {'x', 'y'}),
+            ({'x': 1, 'y': '2'}, {'x', 'y'}),
+            ({'x': '1', 'y': 2}, {'x', 'y'}),
+            ({'x': '1', 'y': '2'}, {'x', 'y'}),
+        ]
+        assert [set(validator.validate_python(data)) for data, _ in cases] == [keys for _, keys in cases]
 
 
-def test_smart_union_does_nested_model_field_counting() -> None:
+class TestSmartUnionNestedModelFieldCounting:
     class SubModelA:
         x: int = 1
 
@@ -1029,10 +1252,10 @@ def test_smart_union_does_nested_model_field_counting() -> None:
         y: int = 2
 
     class ModelA:
-        sub: SubModelA
+        sub: 'TestSmartUnionNestedModelFieldCounting.SubModelA'
 
     class ModelB:
-        sub: SubModelB
+        sub: 'TestSmartUnionNestedModelFieldCounting.SubModelB'
 
     model_a_schema = core_schema.model_schema(
         ModelA,
@@ -1074,17 +1297,18 @@ def test_smart_union_does_nested_model_field_counting() -> None:
         ),
     )
 
-    for choices in permute_choices([model_a_schema, model_b_schema]):
+    @pytest.mark.parametrize('choices', permute_choices([model_a_schema, model_b_schema]), ids=_first_choice_cls_name)
+    def test_smart_union_does_nested_model_field_counting(self, choices) -> None:
         validator = SchemaValidator(core_schema.union_schema(choices=choices))
 
-        assert isinstance(validator.validate_python({'sub': {'x': 1}}), ModelA)
-        assert isinstance(validator.validate_python({'sub': {'y': 3}}), ModelB)
+        assert isinstance(validator.validate_python({'sub': {'x': 1}}), self.ModelA)
+        assert isinstance(validator.validate_python({'sub': {'y': 3}}), self.ModelB)
 
         # defaults to leftmost choice if there's a tie
         assert isinstance(validator.validate_python({'sub': {}}), choices[0]['cls'])
 
 
-def test_smart_union_does_nested_dataclass_field_counting() -> None:
+class TestSmartUnionNestedDataclassFieldCounting:
     @dataclass
     class SubModelA:
         x: int = 1
@@ -1095,11 +1319,11 @@ def test_smart_union_does_nested_dataclass_field_counting() -> None:
 
     @dataclass
     class ModelA:
-        sub: SubModelA
+        sub: 'TestSmartUnionNestedDataclassFieldCounting.SubModelA'
 
     @dataclass
     class ModelB:
-        sub: SubModelB
+        sub: 'TestSmartUnionNestedDataclassFieldCounting.SubModelB'
 
     dc_a_schema = core_schema.dataclass_schema(
         ModelA,
@@ -1157,17 +1381,18 @@ def test_smart_union_does_nested_dataclass_field_counting() -> None:
         ['sub'],
     )
 
-    for choices in permute_choices([dc_a_schema, dc_b_schema]):
+    @pytest.mark.parametrize('choices', permute_choices([dc_a_schema, dc_b_schema]), ids=_first_choice_cls_name)
+    def test_smart_union_does_nested_dataclass_field_counting(self, choices) -> None:
         validator = SchemaValidator(core_schema.union_schema(choices=choices))
 
-        assert isinstance(validator.validate_python({'sub': {'x': 1}}), ModelA)
-        assert isinstance(validator.validate_python({'sub': {'y': 3}}), ModelB)
+        assert isinstance(validator.validate_python({'sub': {'x': 1}}), self.ModelA)
+        assert isinstance(validator.validate_python({'sub': {'y': 3}}), self.ModelB)
 
         # defaults to leftmost choice if there's a tie
         assert isinstance(validator.validate_python({'sub': {}}), choices[0]['cls'])
 
 
-def test_smart_union_does_nested_typed_dict_field_counting() -> None:
+class TestSmartUnionNestedTypedDictFieldCounting:
     td_a_schema = core_schema.typed_dict_schema(
         fields={
             'sub': core_schema.typed_dict_field(
@@ -1184,14 +1409,23 @@ def test_smart_union_does_nested_typed_dict_field_counting() -> None:
         }
     )
 
-    for choices in permute_choices([td_a_schema, td_b_schema]):
+    @pytest.mark.parametrize('choices', permute_choices([td_a_schema, td_b_schema]))
+    def test_smart_union_does_nested_typed_dict_field_counting(self, choices) -> None:
         validator = SchemaValidator(core_schema.union_schema(choices=choices))
 
         assert set(validator.validate_python({'sub': {'x': 1}})['sub'].keys()) == {'x'}
         assert set(validator.validate_python({'sub': {'y': 2}})['sub'].keys()) == {'y'}
 
 
-def test_nested_unions_bubble_up_field_count() -> None:
+def _make_three_field_model(cls: type[Any], prefix: str) -> core_schema.ModelSchema:
+    fields = {
+        f'{prefix}{i}': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0))
+        for i in (1, 2, 3)
+    }
+    return core_schema.model_schema(cls, core_schema.model_fields_schema(fields=fields))
+
+
+class TestNestedUnionsBubbleUpFieldCount:
     class SubModelX:
         x1: int = 0
         x2: int = 0
@@ -1213,87 +1447,47 @@ def test_nested_unions_bubble_up_field_count() -> None:
         w3: int = 0
 
     class ModelA:
-        a: Union[SubModelX, SubModelY]
+        a: Union['TestNestedUnionsBubbleUpFieldCount.SubModelX', 'TestNestedUnionsBubbleUpFieldCount.SubModelY']
 
     class ModelB:
-        b: Union[SubModelZ, SubModelW]
-
-    model_x_schema = core_schema.model_schema(
-        SubModelX,
-        core_schema.model_fields_schema(
-            fields={
-                'x1': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-                'x2': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-                'x3': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-            }
-        ),
-    )
+        b: Union['TestNestedUnionsBubbleUpFieldCount.SubModelZ', 'TestNestedUnionsBubbleUpFieldCount.SubModelW']
 
-    model_y_schema = core_schema.model_schema(
-        SubModelY,
-        core_schema.model_fields_schema(
-            fields={
-                'x1': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-                'x2': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-                'x3': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-            }
-        ),
-    )
+    model_x_schema = _make_three_field_model(SubModelX, 'x')
+    model_y_schema = _make_three_field_model(SubModelY, 'x')
+    model_z_schema = _make_three_field_model(SubModelZ, 'z')
+    model_w_schema = _make_three_field_model(SubModelW, 'w')
 
-    model_z_schema = core_schema.model_schema(
-        SubModelZ,
-        core_schema.model_fields_schema(
-            fields={
-                'z1': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-                'z2': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-                'z3': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-            }
-        ),
+    @pytest.mark.parametrize(
+        'model_a_choices', permute_choices([model_x_schema, model_y_schema]), ids=_first_choice_cls_name
     )
-
-    model_w_schema = core_schema.model_schema(
-        SubModelW,
-        core_schema.model_fields_schema(
-            fields={
-                'w1': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-                'w2': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-                'w3': core_schema.model_field(core_schema.with_default_schema(core_schema.int_schema(), default=0)),
-            }
-        ),
+    @pytest.mark.parametrize(
+        'model_b_choices', permute_choices([model_z_schema, model_w_schema]), ids=_first_choice_cls_name
     )
-
-    model_a_schema_options = [
-        core_schema.union_schema([model_x_schema, model_y_schema]),
-        core_schema.union_schema([model_y_schema, model_x_schema]),
-    ]
-
-    model_b_schema_options = [
-        core_schema.union_schema([model_z_schema, model_w_schema]),
-        core_schema.union_schema([model_w_schema, model_z_schema]),
-    ]
-
-    for model_a_schema in model_a_schema_options:
-        for model_b_schema in model_b_schema_options:
-            validator = SchemaValidator(
-                schema=core_schema.union_schema(
-                    [
-                        core_schema.model_schema(
-                            ModelA,
-                            core_schema.model_fields_schema(fields={'a': core_schema.model_field(model_a_schema)}),
+    def test_nested_unions_bubble_up_field_count(self, model_a_choices, model_b_choices) -> None:
+        validator = SchemaValidator(
+            schema=core_schema.union_schema(
+                [
+                    core_schema.model_schema(
+                        self.ModelA,
+                        core_schema.model_fields_schema(
+                            fields={'a': core_schema.model_field(core_schema.union_schema(model_a_choices))}
                         ),
-                        core_schema.model_schema(
-                            ModelB,
-                            core_schema.model_fields_schema(fields={'b': core_schema.model_field(model_b_schema)}),
+                    ),
+                    core_schema.model_schema(
+                        self.ModelB,
+                        core_schema.model_fields_schema(
+                            fields={'b': core_schema.model_field(core_schema.union_schema(model_b_choices))}
                         ),
-                    ]
-                )
+                    ),
+                ]
             )
+        )
 
-            result = validator.validate_python(
-                {'a': {'x1': 1, 'x2': 2, 'y1': 1, 'y2': 2}, 'b': {'w1': 1, 'w2': 2, 'w3': 3}}
-            )
-            assert isinstance(result, ModelB)
-            assert isinstance(result.b, SubModelW)
+        result = validator.validate_python(
+            {'a': {'x1': 1, 'x2': 2, 'y1': 1, 'y2': 2}, 'b': {'w1': 1, 'w2': 2, 'w3': 3}}
+        )
+        assert isinstance(result, self.ModelB)
+        assert isinstance(result.b, self.SubModelW)
 
 
 @pytest.mark.parametrize('extra_behavior', ['forbid', 'ignore', 'allow'])
@@ -1349,7 +1543,11 @@ def test_smart_union_extra_behavior(extra_behavior) -> None:
     assert isinstance(validator.validate_python({'x': {'bar': 'bar'}}).x, Bar)
 
 
-def test_smart_union_wrap_validator_should_not_change_nested_model_field_counts() -> None:
+def _passthrough_wrap(v: Any, handler: core_schema.ValidatorFunctionWrapHandler) -> Any:
+    return handler(v)
+
+
+class TestSmartUnionWrapValidator:
     """Adding a wrap validator on a union member should not affect smart union behavior"""
 
     class SubModel:
@@ -1357,20 +1555,18 @@ def test_smart_union_wrap_validator_should_not_change_nested_model_field_counts(
 
     class ModelA:
         type: str = 'A'
-        sub: SubModel
+        sub: 'TestSmartUnionWrapValidator.SubModel'
 
     class ModelB:
         type: str = 'B'
-        sub: SubModel
+        sub: 'TestSmartUnionWrapValidator.SubModel'
 
     submodel_schema = core_schema.model_schema(
         SubModel,
         core_schema.model_fields_schema(fields={'x': core_schema.model_field(core_schema.str_schema())}),
     )
 
-    wrapped_submodel_schema = core_schema.no_info_wrap_validator_function(
-        lambda v, handler: handler(v), submodel_schema
-    )
+    wrapped_submodel_schema = core_schema.no_info_wrap_validator_function(_passthrough_wrap, submodel_schema)
 
     model_a_schema = core_schema.model_schema(
         ModelA,
@@ -1396,34 +1592,36 @@ def test_smart_union_wrap_validator_should_not_change_nested_model_field_counts(
         ),
     )
 
-    for choices in permute_choices([model_a_schema, model_b_schema]):
-        schema = core_schema.union_schema(choices)
-        validator = SchemaValidator(schema)
+    @pytest.mark.parametrize('choices', permute_choices([model_a_schema, model_b_schema]), ids=_first_choice_cls_name)
+    def test_smart_union_wrap_validator_should_not_change_nested_model_field_counts(self, choices) -> None:
+        validator = SchemaValidator(core_schema.union_schema(choices))
 
-        assert isinstance(validator.validate_python({'type': 'A', 'sub': {'x': 'x'}}), ModelA)
-        assert isinstance(validator.validate_python({'type': 'B', 'sub': {'x': 'x'}}), ModelB)
+        assert isinstance(validator.validate_python({'type': 'A', 'sub': {'x': 'x'}}), self.ModelA)
+        assert isinstance(validator.validate_python({'type': 'B', 'sub': {'x': 'x'}}), self.ModelB)
 
         # defaults to leftmost choice if there's a tie
         assert isinstance(validator.validate_python({'sub': {'x': 'x'}}), choices[0]['cls'])
 
-    # test validate_assignment
-    class RootModel:
-        ab: Union[ModelA, ModelB]
+    def test_smart_union_wrap_validator_validate_assignment(self) -> None:
+        class RootModel:
+            ab: Union[self.ModelA, self.ModelB]
 
-    root_model = core_schema.model_schema(
-        RootModel,
-        core_schema.model_fields_schema(
-            fields={'ab': core_schema.model_field(core_schema.union_schema([model_a_schema, model_b_schema]))}
-        ),
-    )
+        root_model = core_schema.model_schema(
+            RootModel,
+            core_schema.model_fields_schema(
+                fields={
+                    'ab': core_schema.model_field(core_schema.union_schema([self.model_a_schema, self.model_b_schema]))
+                }
+            ),
+        )
 
-    validator = SchemaValidator(root_model)
-    m = validator.validate_python({'ab': {'type': 'B', 'sub': {'x': 'x'}}})
-    assert isinstance(m, RootModel)
-    assert isinstance(m.ab, ModelB)
-    assert m.ab.sub.x == 'x'
+        validator = SchemaValidator(root_model)
+        m = validator.validate_python({'ab': {'type': 'B', 'sub': {'x': 'x'}}})
+        assert isinstance(m, RootModel)
+        assert isinstance(m.ab, self.ModelB)
+        assert m.ab.sub.x == 'x'
 
-    m = validator.validate_assignment(m, 'ab', {'sub': {'x': 'y'}})
-    assert isinstance(m, RootModel)
-    assert isinstance(m.ab, ModelA)
-    assert m.ab.sub.x == 'y'
+        m = validator.validate_assignment(m, 'ab', {'sub': {'x': 'y'}})
+        assert isinstance(m, RootModel)
+        assert isinstance(m.ab, self.ModelA)
+        assert m.ab.sub.x == 'y'